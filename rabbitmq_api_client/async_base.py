@@ -0,0 +1,234 @@
+import httpx
+import orjson
+
+from rabbitmq_api_client.exceptions import RabbitMQAPIError
+
+
+class AsyncBaseClient:
+	"""Async base client for making HTTP requests with basic authentication.
+
+	Args:
+		base_url (str): The base URL of the API.
+		username (str): The username for basic authentication.
+		password (str): The password for basic authentication.
+		http2 (bool, optional): Negotiate HTTP/2 when the server supports it
+			(RabbitMQ >= 3.11). Concurrent requests then multiplex over a
+			single connection instead of queueing behind HTTP/1.1
+			head-of-line blocking; with
+			``limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)``
+			a whole gather runs on one socket.
+		retries (int, optional): Connection-level retries for the transport.
+		limits (httpx.Limits, optional): Connection pool limits. Defaults to a
+			large keep-alive pool so sustained callers reuse warm connections.
+		timeout (httpx.Timeout, optional): Request timeout. Defaults to 10s
+			with a 5s connect timeout.
+
+	Attributes:
+		base_url (str): The base URL of the API.
+		username (str): The username for basic authentication.
+		password (str): The password for basic authentication.
+		client (httpx.AsyncClient): The HTTP client for making requests.
+
+	Methods:
+		request: Make a generic HTTP request.
+		get: Make a GET request.
+		post: Make a POST request.
+		put: Make a PUT request.
+		delete: Make a DELETE request.
+		close: Close the HTTP client.
+		__repr__: String representation of the AsyncBaseClient instance.
+
+	Example:
+		client = AsyncBaseClient("https://api.example.com", "user", "pass")
+		response = await client.get("/resource")
+		print(response)
+	"""
+
+	def __init__(
+		self,
+		base_url: str,
+		username: str,
+		password: str,
+		http2: bool = True,
+		retries: int = 2,
+		limits: httpx.Limits = None,
+		timeout: httpx.Timeout = None,
+	):
+		"""Initialize the AsyncBaseClient with the provided base URL, username, and password."""
+		self.base_url = base_url
+		self.username = username
+		self.password = password
+		if limits is None:
+			limits = httpx.Limits(
+				max_connections=100, max_keepalive_connections=100, keepalive_expiry=300
+			)
+		if timeout is None:
+			timeout = httpx.Timeout(10.0, connect=5.0)
+		self.client = httpx.AsyncClient(
+			base_url=self.base_url,
+			auth=(self.username, self.password),
+			timeout=timeout,
+			headers={'Accept-Encoding': 'gzip, deflate'},
+			transport=httpx.AsyncHTTPTransport(retries=retries, limits=limits, http2=http2),
+		)
+		# Bound once so each verb method reaches httpx without bouncing
+		# through two extra Python frames per call.
+		self._request = self.client.request
+
+	async def request(self, method: str, url: str, **kwargs):
+		"""Make a generic HTTP request.
+
+		Args:
+			method (str): The HTTP method (e.g., 'get', 'post', 'put', 'delete').
+			url (str): The URL for the request.
+			**kwargs: Additional keyword arguments to pass to the request.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+
+		Raises:
+			RabbitMQAPIError: If the response status code is not in the 2xx range.
+		"""
+		return self._check_and_parse(await self._request(method, url, **kwargs))
+
+	def _check_and_parse(self, response):
+		"""Raise on a non-2xx response and decode the body."""
+		if not (200 <= response.status_code < 300):
+			raise RabbitMQAPIError(response, response.status_code, response.text)
+		content = response.content
+		if not content:
+			return {}
+		try:
+			return orjson.loads(content)
+		except orjson.JSONDecodeError:
+			return content.decode('utf-8', 'replace')
+
+	async def get(self, url: str, params: dict = None):
+		"""Make a GET request.
+
+		Args:
+			url (str): The URL for the GET request.
+			params (dict, optional): Additional parameters for the GET request.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(await self._request('get', url, params=params))
+
+	async def post(self, url: str, data: dict = None):
+		"""Make a POST request.
+
+		Args:
+			url (str): The URL for the POST request.
+			data (dict, optional): The JSON data to include in the POST request.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(
+			await self._request(
+				'post',
+				url,
+				content=orjson.dumps(data) if data is not None else None,
+				headers={'Content-Type': 'application/json'},
+			)
+		)
+
+	async def put(self, url: str, data: dict = None):
+		"""Make a PUT request.
+
+		Args:
+			url (str): The URL for the PUT request.
+			data (dict, optional): The JSON data to include in the PUT request.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(
+			await self._request(
+				'put',
+				url,
+				content=orjson.dumps(data) if data is not None else None,
+				headers={'Content-Type': 'application/json'},
+			)
+		)
+
+	async def get_json_as(self, url: str, adapter, params: dict = None):
+		"""Make a GET request and validate the body straight into models.
+
+		The adapter's ``validate_json`` parses the raw response bytes inside
+		pydantic-core, skipping the intermediate dict tree that ``get``
+		builds. Pass a module-level ``pydantic.TypeAdapter`` (e.g.
+		``schemas.QUEUES_ADAPTER``) so the core schema is built only once.
+
+		Args:
+			url (str): The URL for the GET request.
+			adapter (pydantic.TypeAdapter): Adapter for the expected response type.
+			params (dict, optional): Additional parameters for the GET request.
+
+		Returns:
+			The validated response object.
+
+		Raises:
+			RabbitMQAPIError: If the response status code is not in the 2xx range.
+		"""
+		response = await self._request('get', url, params=params)
+		if not (200 <= response.status_code < 300):
+			raise RabbitMQAPIError(response, response.status_code, response.text)
+		return adapter.validate_json(response.content)
+
+	async def post_raw(self, url: str, body: bytes):
+		"""Make a POST request with a pre-serialized JSON body.
+
+		Args:
+			url (str): The URL for the POST request.
+			body (bytes): The JSON-encoded request body.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(
+			await self._request('post', url, content=body, headers={'Content-Type': 'application/json'})
+		)
+
+	async def put_raw(self, url: str, body: bytes):
+		"""Make a PUT request with a pre-serialized JSON body.
+
+		Args:
+			url (str): The URL for the PUT request.
+			body (bytes): The JSON-encoded request body.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(
+			await self._request('put', url, content=body, headers={'Content-Type': 'application/json'})
+		)
+
+	async def delete(self, url: str):
+		"""Make a DELETE request.
+
+		Args:
+			url (str): The URL for the DELETE request.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(await self._request('delete', url))
+
+	async def close(self):
+		"""Close the HTTP client."""
+		await self.client.aclose()
+
+	async def __aenter__(self):
+		"""Enter the async context manager."""
+		await self.client.__aenter__()
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		"""Exit the async context manager and close the client."""
+		await self.client.__aexit__(exc_type, exc_value, traceback)
+
+	def __repr__(self):
+		"""String representation of the AsyncBaseClient instance."""
+		return f'<{self.__class__.__name__} {self.base_url}>'
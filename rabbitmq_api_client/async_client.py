@@ -0,0 +1,532 @@
+import asyncio
+
+import orjson
+
+from rabbitmq_api_client.async_base import AsyncBaseClient
+from rabbitmq_api_client.client import (
+	_BINDING_PATH,
+	_DEFINITIONS_PATH,
+	_EXCHANGE_PATH,
+	_PERMISSION_PATH,
+	_QUEUE_PATH,
+	_USER_PATH,
+	_USER_PERMISSIONS_PATH,
+	_USER_TOPIC_PERMISSIONS_PATH,
+	_VHOST_BINDINGS_PATH,
+	_VHOST_DEFINITIONS_PATH,
+	_VHOST_EXCHANGES_PATH,
+	_VHOST_PATH,
+	_VHOST_QUEUES_PATH,
+	_list_params,
+	_q,
+)
+from rabbitmq_api_client.fast_schemas import FastQueue
+from rabbitmq_api_client.schemas import (
+	Binding,
+	CreateQueue,
+	CreateQueuePayload,
+	CreateUser,
+	CreateUserPayload,
+	CreateVhost,
+	CreateVhostPayload,
+	Exchange,
+	Permissions,
+)
+
+DEFAULT_CONCURRENCY = 50
+
+
+class AsyncRabbitMQClient(AsyncBaseClient):
+	"""
+	Async RabbitMQ client for interacting with the RabbitMQ server API.
+
+	All methods mirror :class:`rabbitmq_api_client.client.RabbitMQClient` but are
+	coroutines, so bulk workflows can overlap their round-trips with
+	``asyncio.gather`` instead of serializing one request per call.
+
+	Args:
+		base_url (str): The base URL of the RabbitMQ server.
+		username (str): The username for authentication.
+		password (str): The password for authentication.
+	"""
+
+	def __init__(self, base_url: str, username: str, password: str, **kwargs):
+		"""Initialize an async RabbitMQ client.
+
+		Args:
+			base_url (str): The base URL of the RabbitMQ server.
+			username (str): The username to use for authentication.
+			password (str): The password to use for authentication.
+			**kwargs: Extra transport options forwarded to
+				:class:`AsyncBaseClient` (``http2``, ``retries``, ``limits``,
+				``timeout``).
+		"""
+		super().__init__(base_url, username, password, **kwargs)
+
+	async def get_overview(self) -> dict:
+		"""Get an overview of the RabbitMQ server.
+
+		Returns:
+			dict: Overview information.
+		"""
+		return await self.get('/api/overview')
+
+	async def get_cluster_name(self) -> dict:
+		"""Get the cluster name of the RabbitMQ server.
+
+		Returns:
+			dict: Cluster name information.
+		"""
+		return await self.get('/api/cluster-name')
+
+	async def get_vhosts(self) -> list[dict]:
+		"""Get all vhosts on the RabbitMQ server.
+
+		Returns:
+			list[dict]: A list of vhosts.
+		"""
+		return await self.get('/api/vhosts')
+
+	async def get_vhost(self, vhost: str) -> dict:
+		"""Get a vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): The name of the vhost.
+
+		Returns:
+			dict: Information about the specified vhost.
+		"""
+		return await self.get(_VHOST_PATH % _q(vhost))
+
+	async def create_vhost(self, vhost: CreateVhost | CreateVhostPayload) -> dict:
+		"""Create a new vhost on the RabbitMQ server.
+
+		Args:
+			vhost (CreateVhost | CreateVhostPayload): Pydantic model representing
+				the vhost, or a precomputed payload dict including the ``name`` key.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		if isinstance(vhost, dict):
+			vhost_dict = dict(vhost)
+			name = vhost_dict.pop('name')
+		else:
+			# The schema fields are already JSON-serializable primitives, so the
+			# explicitly-set ones can be picked straight off the model without
+			# the O(total fields) model_dump(exclude_unset=True) pass.
+			vhost_dict = {key: getattr(vhost, key) for key in vhost.model_fields_set if key != 'name'}
+			name = vhost.name
+		return await self.put(_VHOST_PATH % _q(name), vhost_dict)
+
+	async def delete_vhost(self, vhost: str) -> dict:
+		"""Delete a vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		return await self.delete(_VHOST_PATH % _q(vhost))
+
+	async def get_queues(
+		self,
+		page: int = None,
+		page_size: int = None,
+		name: str = None,
+		use_regex: bool = False,
+		columns: list[str] = None,
+	) -> list[dict] | dict:
+		"""Get all queues on the RabbitMQ server.
+
+		Args:
+			page (int, optional): Page number to fetch; enables pagination.
+			page_size (int, optional): Number of queues per page.
+			name (str, optional): Filter queues by name.
+			use_regex (bool, optional): Treat ``name`` as a regular expression.
+			columns (list[str], optional): Restrict each queue to these fields;
+				the server drops everything else before serializing.
+
+		Returns:
+			list[dict] | dict: A list of queues, or a pagination envelope
+			(``items``, ``page_count``, ...) when ``page`` is given.
+		"""
+		return await self.get('/api/queues', params=_list_params(page, page_size, name, use_regex, columns))
+
+	async def iter_queues(
+		self, page_size: int = 500, name: str = None, use_regex: bool = False, columns: list[str] = None
+	):
+		"""Iterate over all queues, fetching the pages concurrently.
+
+		The first page reveals the page count; the remaining pages are then
+		fetched with ``asyncio.gather`` and yielded in order.
+
+		Args:
+			page_size (int, optional): Number of queues per page.
+			name (str, optional): Filter queues by name.
+			use_regex (bool, optional): Treat ``name`` as a regular expression.
+			columns (list[str], optional): Restrict each queue to these fields.
+
+		Yields:
+			dict: One queue at a time.
+		"""
+		first = await self.get_queues(page=1, page_size=page_size, name=name, use_regex=use_regex, columns=columns)
+		for queue in first['items']:
+			yield queue
+		pages = await asyncio.gather(
+			*(
+				self.get_queues(page=page, page_size=page_size, name=name, use_regex=use_regex, columns=columns)
+				for page in range(2, first['page_count'] + 1)
+			)
+		)
+		for response in pages:
+			for queue in response['items']:
+				yield queue
+
+	async def get_vhost_queues(self, vhost: str) -> list[dict]:
+		"""Get all queues for a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+
+		Returns:
+			list[dict]: List of queues for the specified vhost.
+		"""
+		return await self.get(_VHOST_QUEUES_PATH % _q(vhost))
+
+	async def create_queue(self, vhost: str, queue: CreateQueue | CreateQueuePayload) -> dict:
+		"""Create a new queue on a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+			queue (CreateQueue | CreateQueuePayload): Pydantic model representing
+				the queue, or a precomputed payload dict including the ``name``
+				key. A dict is sent as-is, so callers creating many similar queues
+				can build the template once instead of re-dumping a model per call.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		if isinstance(queue, dict):
+			queue_dict = dict(queue)
+			name = queue_dict.pop('name')
+		else:
+			queue_dict = {key: getattr(queue, key) for key in queue.model_fields_set if key != 'name'}
+			name = queue.name
+		return await self.put(_QUEUE_PATH % (_q(vhost), _q(name)), queue_dict)
+
+	async def get_vhost_queue(self, vhost: str, queue_name: str) -> dict:
+		"""Get a queue on a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+			queue_name (str): Name of the queue.
+
+		Returns:
+			dict: Information about the specified queue.
+		"""
+		return await self.get(_QUEUE_PATH % (_q(vhost), _q(queue_name)))
+
+	async def create_queue_fast(self, vhost: str, queue: FastQueue) -> dict:
+		"""Create a queue from a FastQueue dataclass, skipping validation.
+
+		Args:
+			vhost (str): Name of the vhost.
+			queue (FastQueue): Dataclass representing the queue.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		return await self.put_raw(_QUEUE_PATH % (_q(vhost), _q(queue.name)), orjson.dumps(queue))
+
+	async def bulk_create_queues(
+		self, vhost: str, queues: list[CreateQueue], concurrency: int = DEFAULT_CONCURRENCY
+	) -> list[dict]:
+		"""Create many queues on a vhost concurrently.
+
+		The creations are issued with ``asyncio.gather``, bounded by a semaphore
+		so a large batch does not exhaust the connection pool or the broker.
+
+		Args:
+			vhost (str): Name of the vhost.
+			queues (list[CreateQueue]): Pydantic models representing the queues.
+			concurrency (int, optional): Maximum number of in-flight requests.
+
+		Returns:
+			list[dict]: One response per queue, in input order.
+		"""
+		semaphore = asyncio.Semaphore(concurrency)
+
+		async def create(queue: CreateQueue) -> dict:
+			async with semaphore:
+				return await self.create_queue(vhost, queue)
+
+		return list(await asyncio.gather(*(create(queue) for queue in queues)))
+
+	async def get_users(self) -> list:
+		"""Get all users on the RabbitMQ server.
+
+		Returns:
+			list: List of users.
+		"""
+		return await self.get('/api/users')
+
+	async def get_user(self, username: str) -> dict:
+		"""Get a user on the RabbitMQ server.
+
+		Args:
+			username (str): Name of the user.
+
+		Returns:
+			dict: Information about the specified user.
+		"""
+		return await self.get(_USER_PATH % _q(username))
+
+	async def create_user(self, user: CreateUser | CreateUserPayload) -> dict:
+		"""Create a new user on the RabbitMQ server.
+
+		Args:
+			user (CreateUser | CreateUserPayload): Pydantic model representing the
+				user, or a precomputed payload dict including the ``name`` key.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		if isinstance(user, dict):
+			name = user['name']
+			body = {'password': user['password'], 'tags': user.get('tags', '')}
+		else:
+			name = user.name
+			body = {'password': user.password, 'tags': user.tags}
+		return await self.put(_USER_PATH % _q(name), body)
+
+	async def delete_user(self, username: str) -> dict:
+		"""Delete a user on the RabbitMQ server.
+
+		Args:
+			username (str): Name of the user.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		return await self.delete(_USER_PATH % _q(username))
+
+	async def get_user_permissions(self, username: str) -> list[dict]:
+		"""Get the permissions of a user on the RabbitMQ server.
+
+		Args:
+			username (str): Name of the user.
+
+		Returns:
+			list[dict]: List of permissions for the specified user.
+		"""
+		return await self.get(_USER_PERMISSIONS_PATH % _q(username))
+
+	async def get_user_topic_permissions(self, username: str) -> list[dict]:
+		"""Get the topic permissions of a user on the RabbitMQ server.
+
+		Args:
+			username (str): Name of the user.
+
+		Returns:
+			list[dict]: List of topic permissions for the specified user.
+		"""
+		return await self.get(_USER_TOPIC_PERMISSIONS_PATH % _q(username))
+
+	async def get_users_without_permissions(self) -> list[dict]:
+		"""Get all users without permissions on the RabbitMQ server.
+
+		Returns:
+			list[dict]: List of users without permissions.
+		"""
+		return await self.get('/api/users-without-permissions')
+
+	async def get_permissions(self) -> list[dict]:
+		"""Get all permissions on the RabbitMQ server.
+
+		Returns:
+			list[dict]: List of permissions.
+		"""
+		return await self.get('/api/permissions')
+
+	async def get_user_permissions_on_vhost(self, username: str, vhost: str) -> dict:
+		"""Get the permissions of a user on a specific vhost on the RabbitMQ server.
+
+		Args:
+			username (str): Name of the user.
+			vhost (str): Name of the vhost.
+
+		Returns:
+			dict: Permissions for the specified user on the specified vhost.
+		"""
+		return await self.get(_PERMISSION_PATH % (_q(vhost), _q(username)))
+
+	async def create_user_permissions_on_vhost(
+		self, username: str, vhost: str, permissions: Permissions | dict
+	) -> dict:
+		"""Create permissions for a user on a specific vhost on the RabbitMQ server.
+
+		Args:
+			username (str): Name of the user.
+			vhost (str): Name of the vhost.
+			permissions (Permissions | dict): Pydantic model representing the
+				permissions, or a precomputed payload dict.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		if isinstance(permissions, dict):
+			return await self.put(_PERMISSION_PATH % (_q(vhost), _q(username)), permissions)
+		return await self.put_raw(_PERMISSION_PATH % (_q(vhost), _q(username)), permissions.to_body_bytes())
+
+	async def delete_user_permissions_on_vhost(self, username: str, vhost: str) -> dict:
+		"""Delete permissions for a user on a specific vhost on the RabbitMQ server.
+
+		Args:
+			username (str): Name of the user.
+			vhost (str): Name of the vhost.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		return await self.delete(_PERMISSION_PATH % (_q(vhost), _q(username)))
+
+	async def get_exchanges(
+		self,
+		page: int = None,
+		page_size: int = None,
+		name: str = None,
+		use_regex: bool = False,
+		columns: list[str] = None,
+	) -> list[dict] | dict:
+		"""Get all exchanges on the RabbitMQ server.
+
+		Args:
+			page (int, optional): Page number to fetch; enables pagination.
+			page_size (int, optional): Number of exchanges per page.
+			name (str, optional): Filter exchanges by name.
+			use_regex (bool, optional): Treat ``name`` as a regular expression.
+			columns (list[str], optional): Restrict each exchange to these
+				fields; the server drops everything else before serializing.
+
+		Returns:
+			list[dict] | dict: A list of exchanges, or a pagination envelope
+			(``items``, ``page_count``, ...) when ``page`` is given.
+		"""
+		return await self.get('/api/exchanges', params=_list_params(page, page_size, name, use_regex, columns))
+
+	async def get_vhost_exchanges(self, vhost: str) -> list[dict]:
+		"""Get all exchanges for a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+
+		Returns:
+			list[dict]: List of exchanges for the specified vhost.
+		"""
+		return await self.get(_VHOST_EXCHANGES_PATH % _q(vhost))
+
+	async def get_vhost_exchange(self, vhost: str, exchange_name: str) -> dict:
+		"""Get an exchange on a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+			exchange_name (str): Name of the exchange.
+
+		Returns:
+			dict: Information about the specified exchange.
+		"""
+		return await self.get(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)))
+
+	async def create_exchange(self, vhost: str, exchange_name: str, exchange: Exchange | dict) -> dict:
+		"""Create a new exchange on a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+			exchange_name (str): Name of the exchange.
+			exchange (Exchange | dict): Pydantic model representing the
+				exchange, or a precomputed payload dict.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		if isinstance(exchange, dict):
+			return await self.put(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)), exchange)
+		return await self.put_raw(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)), exchange.to_body_bytes())
+
+	async def delete_exchange(self, vhost: str, exchange_name: str) -> dict:
+		"""Delete an exchange on a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+			exchange_name (str): Name of the exchange.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		return await self.delete(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)))
+
+	async def get_bindings(self, columns: list[str] = None) -> list[dict]:
+		"""Get all bindings on the RabbitMQ server.
+
+		Args:
+			columns (list[str], optional): Restrict each binding to these
+				fields; the server drops everything else before serializing.
+
+		Returns:
+			list[dict]: A list of bindings.
+		"""
+		return await self.get('/api/bindings', params=_list_params(columns=columns))
+
+	async def get_vhost_bindings(self, vhost: str) -> list[dict]:
+		"""Get all bindings for a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+
+		Returns:
+			list[dict]: List of bindings for the specified vhost.
+		"""
+		return await self.get(_VHOST_BINDINGS_PATH % _q(vhost))
+
+	async def get_vhost_binding(self, vhost: str, exchange: str, queue: str) -> dict:
+		"""Get a binding for a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+			exchange (str): Name of the exchange.
+			queue (str): Name of the queue.
+
+		Returns:
+			dict: Information about the specified binding.
+		"""
+		return await self.get(_BINDING_PATH % (_q(vhost), _q(exchange), _q(queue)))
+
+	async def create_vhost_binding(self, vhost: str, exchange: str, queue: str, binding: Binding):
+		"""Create a new binding for a specific vhost on the RabbitMQ server.
+
+		Args:
+			vhost (str): Name of the vhost.
+			exchange (str): Name of the exchange.
+			queue (str): Name of the queue.
+			binding (Binding): Pydantic model representing the binding.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		return await self.post_raw(_BINDING_PATH % (_q(vhost), _q(exchange), _q(queue)), binding.to_body_bytes())
+
+	async def import_definitions(self, definitions: dict, vhost: str = None) -> dict:
+		"""Import a definitions document on the RabbitMQ server.
+
+		Args:
+			definitions (dict): The definitions document to import.
+			vhost (str, optional): Restrict the import to this vhost.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		if vhost is None:
+			return await self.post(_DEFINITIONS_PATH, definitions)
+		return await self.post(_VHOST_DEFINITIONS_PATH % _q(vhost), definitions)
@@ -1,4 +1,8 @@
+import threading
+import weakref
+
 import httpx
+import orjson
 
 from rabbitmq_api_client.exceptions import RabbitMQAPIError
 
@@ -10,6 +14,15 @@ class BaseClient:
 		base_url (str): The base URL of the API.
 		username (str): The username for basic authentication.
 		password (str): The password for basic authentication.
+		http2 (bool, optional): Negotiate HTTP/2 when the server supports it.
+		retries (int, optional): Connection-level retries for the transport.
+		limits (httpx.Limits, optional): Connection pool limits. Defaults to a
+			large keep-alive pool so sustained callers reuse warm connections.
+		timeout (httpx.Timeout, optional): Request timeout. Defaults to 10s
+			with a 5s connect timeout.
+		shared (bool, optional): Reuse one process-wide httpx client per
+			(base_url, username, password). Pass False for a private pool
+			that closes with this instance.
 
 	Attributes:
 		base_url (str): The base URL of the API.
@@ -24,7 +37,8 @@ class BaseClient:
 		put: Make a PUT request.
 		delete: Make a DELETE request.
 		close: Close the HTTP client.
-		__del__: Destructor to automatically close the client on object deletion.
+		__enter__: Enter the context manager.
+		__exit__: Exit the context manager and close the client.
 		__repr__: String representation of the BaseClient instance.
 
 	Example:
@@ -32,13 +46,63 @@ class BaseClient:
 		response = client.get("/resource")
 		print(response)
 	"""
-	def __init__(self, base_url: str, username: str, password: str):
+	# Process-wide pool of httpx clients keyed by (base_url, username,
+	# password), so short-lived BaseClient objects pointing at the same
+	# broker keep reusing one warm connection pool. The first construction
+	# for a key decides its transport settings.
+	_POOL: dict = {}
+	_POOL_LOCK = threading.Lock()
+
+	def __init__(
+		self,
+		base_url: str,
+		username: str,
+		password: str,
+		http2: bool = True,
+		retries: int = 2,
+		limits: httpx.Limits = None,
+		timeout: httpx.Timeout = None,
+		shared: bool = True,
+	):
 		"""Initialize the BaseClient with the provided base URL, username, and password."""
 		self.base_url = base_url
 		self.username = username
 		self.password = password
-		self.client = httpx.Client(
-			base_url=self.base_url, auth=(self.username, self.password)
+		self._owns_client = not shared
+		if shared:
+			key = (base_url, username, password)
+			with BaseClient._POOL_LOCK:
+				client = BaseClient._POOL.get(key)
+				if client is None or client.is_closed:
+					client = self._build_client(http2, retries, limits, timeout)
+					BaseClient._POOL[key] = client
+			self.client = client
+		else:
+			self.client = self._build_client(http2, retries, limits, timeout)
+			# Close the pool when the instance is collected. Unlike a __del__
+			# method, a finalizer neither resurrects the object nor forces the
+			# cyclic GC onto its slow path.
+			self._finalizer = weakref.finalize(self, self.client.close)
+		# Bound once so each verb method reaches httpx without bouncing
+		# through two extra Python frames per call.
+		self._request = self.client.request
+
+	def _build_client(
+		self, http2: bool, retries: int, limits: httpx.Limits, timeout: httpx.Timeout
+	) -> httpx.Client:
+		"""Build the underlying httpx client with the production defaults."""
+		if limits is None:
+			limits = httpx.Limits(
+				max_connections=100, max_keepalive_connections=100, keepalive_expiry=300
+			)
+		if timeout is None:
+			timeout = httpx.Timeout(10.0, connect=5.0)
+		return httpx.Client(
+			base_url=self.base_url,
+			auth=(self.username, self.password),
+			timeout=timeout,
+			headers={'Connection': 'keep-alive', 'Accept-Encoding': 'gzip, deflate'},
+			transport=httpx.HTTPTransport(retries=retries, limits=limits, http2=http2),
 		)
 
 	def request(self, method: str, url: str, **kwargs):
@@ -54,16 +118,19 @@ class BaseClient:
 		Raises:
 			RabbitMQAPIError: If the response status code is not in the 2xx range.
 		"""
-		response = self.client.request(method, url, **kwargs)
+		return self._check_and_parse(self._request(method, url, **kwargs))
+
+	def _check_and_parse(self, response):
+		"""Raise on a non-2xx response and decode the body."""
 		if not (200 <= response.status_code < 300):
 			raise RabbitMQAPIError(response, response.status_code, response.text)
-		if response.text.strip():
-			try:
-				return response.json()
-			except ValueError:
-				return response.text
-		else:
+		content = response.content
+		if not content:
 			return {}
+		try:
+			return orjson.loads(content)
+		except orjson.JSONDecodeError:
+			return content.decode('utf-8', 'replace')
 
 	def get(self, url: str, params: dict = None):
 		"""Make a GET request.
@@ -74,7 +141,7 @@ class BaseClient:
 		Returns:
 			dict or str: The JSON response if available, or the raw text response.
 		"""
-		return self.request('get', url, params=params)
+		return self._check_and_parse(self._request('get', url, params=params))
 
 	def post(self, url: str, data: dict = None):
 		"""Make a POST request.
@@ -85,7 +152,14 @@ class BaseClient:
 		Returns:
 			dict or str: The JSON response if available, or the raw text response.
 		"""
-		return self.request('post', url, json=data)
+		return self._check_and_parse(
+			self._request(
+				'post',
+				url,
+				content=orjson.dumps(data) if data is not None else None,
+				headers={'Content-Type': 'application/json'},
+			)
+		)
 
 	def put(self, url: str, data: dict = None):
 		"""Make a PUT request.
@@ -97,7 +171,70 @@ class BaseClient:
 		Returns:
 			dict or str: The JSON response if available, or the raw text response.
 		"""
-		return self.request('put', url, json=data)
+		return self._check_and_parse(
+			self._request(
+				'put',
+				url,
+				content=orjson.dumps(data) if data is not None else None,
+				headers={'Content-Type': 'application/json'},
+			)
+		)
+
+	def get_json_as(self, url: str, adapter, params: dict = None):
+		"""Make a GET request and validate the body straight into models.
+
+		The adapter's ``validate_json`` parses the raw response bytes inside
+		pydantic-core, skipping the intermediate dict tree that ``get``
+		builds. Pass a module-level ``pydantic.TypeAdapter`` (e.g.
+		``schemas.QUEUES_ADAPTER``) so the core schema is built only once.
+
+		Args:
+			url (str): The URL for the GET request.
+			adapter (pydantic.TypeAdapter): Adapter for the expected response type.
+			params (dict, optional): Additional parameters for the GET request.
+
+		Returns:
+			The validated response object.
+
+		Raises:
+			RabbitMQAPIError: If the response status code is not in the 2xx range.
+		"""
+		response = self._request('get', url, params=params)
+		if not (200 <= response.status_code < 300):
+			raise RabbitMQAPIError(response, response.status_code, response.text)
+		return adapter.validate_json(response.content)
+
+	def post_raw(self, url: str, body: bytes):
+		"""Make a POST request with a pre-serialized JSON body.
+
+		Callers that send the same payload repeatedly can serialize it once
+		(e.g. with ``CreateUser.to_body_bytes()``) and skip the per-call
+		encode.
+
+		Args:
+			url (str): The URL for the POST request.
+			body (bytes): The JSON-encoded request body.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(
+			self._request('post', url, content=body, headers={'Content-Type': 'application/json'})
+		)
+
+	def put_raw(self, url: str, body: bytes):
+		"""Make a PUT request with a pre-serialized JSON body.
+
+		Args:
+			url (str): The URL for the PUT request.
+			body (bytes): The JSON-encoded request body.
+
+		Returns:
+			dict or str: The JSON response if available, or the raw text response.
+		"""
+		return self._check_and_parse(
+			self._request('put', url, content=body, headers={'Content-Type': 'application/json'})
+		)
 
 	def delete(self, url: str):
 		"""Make a DELETE request.
@@ -108,14 +245,32 @@ class BaseClient:
 		Returns:
 			dict or str: The JSON response if available, or the raw text response.
 		"""
-		return self.request('delete', url)
+		return self._check_and_parse(self._request('delete', url))
 
 	def close(self):
-		"""Close the HTTP client."""
-		self.client.close()
+		"""Close the HTTP client.
+
+		A no-op for shared clients: the pooled connections stay warm for the
+		next instance pointing at the same broker. Use :meth:`shutdown` to
+		tear the shared pools down (e.g. in test teardown).
+		"""
+		if self._owns_client:
+			self.client.close()
+
+	@classmethod
+	def shutdown(cls):
+		"""Close every pooled client and empty the pool."""
+		with cls._POOL_LOCK:
+			for client in cls._POOL.values():
+				client.close()
+			cls._POOL.clear()
+
+	def __enter__(self):
+		"""Enter the context manager."""
+		return self
 
-	def __del__(self):
-		"""Destructor to automatically close the client on object deletion."""
+	def __exit__(self, exc_type, exc_value, traceback):
+		"""Exit the context manager and close the client if this instance owns it."""
 		self.close()
 
 	def __repr__(self):
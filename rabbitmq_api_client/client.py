@@ -1,7 +1,76 @@
 import urllib.parse
+from functools import lru_cache
+
+import orjson
 
 from rabbitmq_api_client.base import BaseClient
-from rabbitmq_api_client.schemas import CreateQueue, CreateUser, CreateVhost, Permissions, Exchange, Binding
+from rabbitmq_api_client.fast_schemas import FastQueue
+from rabbitmq_api_client.schemas import (
+	Binding,
+	CreateQueue,
+	CreateQueuePayload,
+	CreateUser,
+	CreateUserPayload,
+	CreateVhost,
+	CreateVhostPayload,
+	Exchange,
+	Permissions,
+)
+
+# Precompiled path templates; %-formatting of precomputed (already quoted)
+# arguments is cheaper than rebuilding an f-string per call.
+_VHOST_PATH = '/api/vhosts/%s'
+_VHOST_QUEUES_PATH = '/api/queues/%s'
+_QUEUE_PATH = '/api/queues/%s/%s'
+_USER_PATH = '/api/users/%s'
+_USER_PERMISSIONS_PATH = '/api/users/%s/permissions'
+_USER_TOPIC_PERMISSIONS_PATH = '/api/users/%s/topic-permissions'
+_PERMISSION_PATH = '/api/permissions/%s/%s'
+_VHOST_EXCHANGES_PATH = '/api/exchanges/%s'
+_EXCHANGE_PATH = '/api/exchanges/%s/%s'
+_VHOST_BINDINGS_PATH = '/api/bindings/%s'
+_BINDING_PATH = '/api/bindings/%s/e/%s/q/%s'
+_DEFINITIONS_PATH = '/api/definitions'
+_VHOST_DEFINITIONS_PATH = '/api/definitions/%s'
+
+
+def _list_params(
+	page: int = None,
+	page_size: int = None,
+	name: str = None,
+	use_regex: bool = False,
+	columns: list[str] = None,
+) -> dict:
+	"""Build the list query parameters understood by the management API.
+
+	Every given parameter is forwarded; the server ignores pagination
+	options such as ``page_size`` when ``page`` is absent. Returns None
+	when nothing is requested, so plain calls keep returning the full,
+	unpaginated list form.
+	"""
+	params = {}
+	if page is not None:
+		params['page'] = page
+	if page_size is not None:
+		params['page_size'] = page_size
+	if name is not None:
+		params['name'] = name
+	if use_regex:
+		params['use_regex'] = 'true'
+	if columns is not None:
+		params['columns'] = ','.join(columns)
+	return params or None
+
+
+@lru_cache(maxsize=1024)
+def _q(name: str) -> str:
+	"""Percent-encode a resource name for use in a URL path.
+
+	Vhost/user/queue names form a small repeating set in practice, so the
+	encoded results are memoized to keep `urllib.parse.quote` off the
+	per-request path.
+	"""
+	return urllib.parse.quote(name, safe='')
 
 
 class RabbitMQClient(BaseClient):
@@ -13,15 +82,17 @@ class RabbitMQClient(BaseClient):
 		username (str): The username for authentication.
 		password (str): The password for authentication.
 	"""
-	def __init__(self, base_url: str, username: str, password: str):
+	def __init__(self, base_url: str, username: str, password: str, **kwargs):
 		"""Initialize a RabbitMQ client.
 
 		Args:
 			base_url (str): The base URL of the RabbitMQ server.
 			username (str): The username to use for authentication.
 			password (str): The password to use for authentication.
+			**kwargs: Extra transport options forwarded to :class:`BaseClient`
+				(``http2``, ``retries``, ``limits``, ``timeout``).
 		"""
-		super().__init__(base_url, username, password)
+		super().__init__(base_url, username, password, **kwargs)
 
 	def get_overview(self) -> dict:
 		"""Get an overview of the RabbitMQ server.
@@ -56,21 +127,28 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Information about the specified vhost.
 		"""
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.get(f'/api/vhosts/{vhost}')
+		return self.get(_VHOST_PATH % _q(vhost))
 
-	def create_vhost(self, vhost: CreateVhost) -> dict:
+	def create_vhost(self, vhost: CreateVhost | CreateVhostPayload) -> dict:
 		"""Create a new vhost on the RabbitMQ server.
 
 		Args:
-			vhost (CreateVhost): Pydantic model representing the vhost.
+			vhost (CreateVhost | CreateVhostPayload): Pydantic model representing
+				the vhost, or a precomputed payload dict including the ``name`` key.
 
 		Returns:
 			dict: Empty dictionary.
 		"""
-		vhost_dict = vhost.model_dump(exclude_unset=True)
-		vhost_name = urllib.parse.quote(vhost_dict.pop('name'), safe='')
-		return self.put(f'/api/vhosts/{vhost_name}', vhost_dict)
+		if isinstance(vhost, dict):
+			vhost_dict = dict(vhost)
+			name = vhost_dict.pop('name')
+		else:
+			# The schema fields are already JSON-serializable primitives, so the
+			# explicitly-set ones can be picked straight off the model without
+			# the O(total fields) model_dump(exclude_unset=True) pass.
+			vhost_dict = {key: getattr(vhost, key) for key in vhost.model_fields_set if key != 'name'}
+			name = vhost.name
+		return self.put(_VHOST_PATH % _q(name), vhost_dict)
 
 	def delete_vhost(self, vhost: str) -> dict:
 		"""Delete a vhost on the RabbitMQ server.
@@ -81,16 +159,56 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Empty dictionary.
 		"""
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.delete(f'/api/vhosts/{vhost}')
-
-	def get_queues(self) -> list[dict]:
+		return self.delete(_VHOST_PATH % _q(vhost))
+
+	def get_queues(
+		self,
+		page: int = None,
+		page_size: int = None,
+		name: str = None,
+		use_regex: bool = False,
+		columns: list[str] = None,
+	) -> list[dict] | dict:
 		"""Get all queues on the RabbitMQ server.
 
+		Args:
+			page (int, optional): Page number to fetch; enables pagination.
+			page_size (int, optional): Number of queues per page.
+			name (str, optional): Filter queues by name.
+			use_regex (bool, optional): Treat ``name`` as a regular expression.
+			columns (list[str], optional): Restrict each queue to these fields;
+				the server drops everything else before serializing.
+
 		Returns:
-			list[dict]: A list of queues.
+			list[dict] | dict: A list of queues, or a pagination envelope
+			(``items``, ``page_count``, ...) when ``page`` is given.
+		"""
+		return self.get('/api/queues', params=_list_params(page, page_size, name, use_regex, columns))
+
+	def iter_queues(
+		self, page_size: int = 500, name: str = None, use_regex: bool = False, columns: list[str] = None
+	):
+		"""Iterate over all queues, fetching them page by page.
+
+		Keeps peak memory proportional to the page size instead of the whole
+		collection, which matters on clusters with many queues.
+
+		Args:
+			page_size (int, optional): Number of queues per page.
+			name (str, optional): Filter queues by name.
+			use_regex (bool, optional): Treat ``name`` as a regular expression.
+			columns (list[str], optional): Restrict each queue to these fields.
+
+		Yields:
+			dict: One queue at a time.
 		"""
-		return self.get('/api/queues')
+		page = 1
+		while True:
+			response = self.get_queues(page=page, page_size=page_size, name=name, use_regex=use_regex, columns=columns)
+			yield from response['items']
+			if page >= response['page_count']:
+				return
+			page += 1
 
 	def get_vhost_queues(self, vhost: str) -> list[dict]:
 		"""Get all queues for a specific vhost on the RabbitMQ server.
@@ -101,23 +219,28 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			list[dict]: List of queues for the specified vhost.
 		"""
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.get(f'/api/queues/{vhost}')
+		return self.get(_VHOST_QUEUES_PATH % _q(vhost))
 
-	def create_queue(self, vhost: str, queue: CreateQueue) -> dict:
+	def create_queue(self, vhost: str, queue: CreateQueue | CreateQueuePayload) -> dict:
 		"""Create a new queue on a specific vhost on the RabbitMQ server.
 
 		Args:
 			vhost (str): Name of the vhost.
-			queue (CreateQueue): Pydantic model representing the queue.
+			queue (CreateQueue | CreateQueuePayload): Pydantic model representing
+				the queue, or a precomputed payload dict including the ``name``
+				key. A dict is sent as-is, so callers creating many similar queues
+				can build the template once instead of re-dumping a model per call.
 
 		Returns:
 			dict: Empty dictionary.
 		"""
-		queue_dict = queue.model_dump(exclude_unset=True)
-		queue_name = urllib.parse.quote(queue_dict.pop('name'), safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.put(f'/api/queues/{vhost}/{queue_name}', queue_dict)
+		if isinstance(queue, dict):
+			queue_dict = dict(queue)
+			name = queue_dict.pop('name')
+		else:
+			queue_dict = {key: getattr(queue, key) for key in queue.model_fields_set if key != 'name'}
+			name = queue.name
+		return self.put(_QUEUE_PATH % (_q(vhost), _q(name)), queue_dict)
 
 	def get_vhost_queue(self, vhost: str, queue_name: str) -> dict:
 		"""Get a queue on a specific vhost on the RabbitMQ server.
@@ -129,9 +252,23 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Information about the specified queue.
 		"""
-		queue_name = urllib.parse.quote(queue_name, safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.get(f'/api/queues/{vhost}/{queue_name}')
+		return self.get(_QUEUE_PATH % (_q(vhost), _q(queue_name)))
+
+	def create_queue_fast(self, vhost: str, queue: FastQueue) -> dict:
+		"""Create a queue from a FastQueue dataclass, skipping validation.
+
+		For trusted bulk callers: orjson serializes the dataclass directly
+		(name included, as in the definitions format), so neither pydantic
+		validation nor an intermediate dict is paid per queue.
+
+		Args:
+			vhost (str): Name of the vhost.
+			queue (FastQueue): Dataclass representing the queue.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		return self.put_raw(_QUEUE_PATH % (_q(vhost), _q(queue.name)), orjson.dumps(queue))
 
 	def get_users(self) -> list:
 		"""Get all users on the RabbitMQ server.
@@ -150,20 +287,25 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Information about the specified user.
 		"""
-		return self.get(f'/api/users/{username}')
+		return self.get(_USER_PATH % _q(username))
 
-	def create_user(self, user: CreateUser) -> dict:
+	def create_user(self, user: CreateUser | CreateUserPayload) -> dict:
 		"""Create a new user on the RabbitMQ server.
 
 		Args:
-			user (CreateUser): Pydantic model representing the user.
+			user (CreateUser | CreateUserPayload): Pydantic model representing the
+				user, or a precomputed payload dict including the ``name`` key.
 
 		Returns:
 			dict: Empty dictionary.
 		"""
-		return self.put(
-			f'/api/users/{user.name}', {'password': user.password, 'tags': user.tags}
-		)
+		if isinstance(user, dict):
+			name = user['name']
+			body = {'password': user['password'], 'tags': user.get('tags', '')}
+		else:
+			name = user.name
+			body = {'password': user.password, 'tags': user.tags}
+		return self.put(_USER_PATH % _q(name), body)
 
 	def delete_user(self, username: str) -> dict:
 		"""Delete a user on the RabbitMQ server.
@@ -174,7 +316,7 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Empty dictionary.
 		"""
-		return self.delete(f'/api/users/{username}')
+		return self.delete(_USER_PATH % _q(username))
 
 	def get_user_permissions(self, username: str) -> list[dict]:
 		"""Get the permissions of a user on the RabbitMQ server.
@@ -185,7 +327,7 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			list[dict]: List of permissions for the specified user.
 		"""
-		return self.get(f'/api/users/{username}/permissions')
+		return self.get(_USER_PERMISSIONS_PATH % _q(username))
 
 	def get_user_topic_permissions(self, username: str) -> list[dict]:
 		"""Get the topic permissions of a user on the RabbitMQ server.
@@ -196,7 +338,7 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			list[dict]: List of topic permissions for the specified user.
 		"""
-		return self.get(f'/api/users/{username}/topic-permissions')
+		return self.get(_USER_TOPIC_PERMISSIONS_PATH % _q(username))
 
 	def get_users_without_permissions(self) -> list[dict]:
 		"""Get all users without permissions on the RabbitMQ server.
@@ -224,24 +366,23 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Permissions for the specified user on the specified vhost.
 		"""
-		username = urllib.parse.quote(username, safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.get(f'/api/permissions/{vhost}/{username}')
+		return self.get(_PERMISSION_PATH % (_q(vhost), _q(username)))
 
-	def create_user_permissions_on_vhost(self, username: str, vhost: str, permissions: Permissions) -> dict:
+	def create_user_permissions_on_vhost(self, username: str, vhost: str, permissions: Permissions | dict) -> dict:
 		"""Create permissions for a user on a specific vhost on the RabbitMQ server.
 
 		Args:
 			username (str): Name of the user.
 			vhost (str): Name of the vhost.
-			permissions (Permissions): Pydantic model representing the permissions.
+			permissions (Permissions | dict): Pydantic model representing the
+				permissions, or a precomputed payload dict.
 
 		Returns:
 			dict: Empty dictionary.
 		"""
-		username = urllib.parse.quote(username, safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.put(f'/api/permissions/{vhost}/{username}', permissions.model_dump())
+		if isinstance(permissions, dict):
+			return self.put(_PERMISSION_PATH % (_q(vhost), _q(username)), permissions)
+		return self.put_raw(_PERMISSION_PATH % (_q(vhost), _q(username)), permissions.to_body_bytes())
 
 	def delete_user_permissions_on_vhost(self, username: str, vhost: str) -> dict:
 		"""Delete permissions for a user on a specific vhost on the RabbitMQ server.
@@ -252,16 +393,31 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Empty dictionary.
 		"""
-		username = urllib.parse.quote(username, safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.delete(f'/api/permissions/{vhost}/{username}')
-
-	def get_exchanges(self) -> list[dict]:
+		return self.delete(_PERMISSION_PATH % (_q(vhost), _q(username)))
+
+	def get_exchanges(
+		self,
+		page: int = None,
+		page_size: int = None,
+		name: str = None,
+		use_regex: bool = False,
+		columns: list[str] = None,
+	) -> list[dict] | dict:
 		"""Get all exchanges on the RabbitMQ server.
+
+		Args:
+			page (int, optional): Page number to fetch; enables pagination.
+			page_size (int, optional): Number of exchanges per page.
+			name (str, optional): Filter exchanges by name.
+			use_regex (bool, optional): Treat ``name`` as a regular expression.
+			columns (list[str], optional): Restrict each exchange to these
+				fields; the server drops everything else before serializing.
+
 		Returns:
-			list[dict]: A list of exchanges.
+			list[dict] | dict: A list of exchanges, or a pagination envelope
+			(``items``, ``page_count``, ...) when ``page`` is given.
 		"""
-		return self.get('/api/exchanges')
+		return self.get('/api/exchanges', params=_list_params(page, page_size, name, use_regex, columns))
 
 	def get_vhost_exchanges(self, vhost: str) -> list[dict]:
 		"""Get all exchanges for a specific vhost on the RabbitMQ server.
@@ -272,8 +428,7 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			list[dict]: List of exchanges for the specified vhost.
 		"""
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.get(f'/api/exchanges/{vhost}')
+		return self.get(_VHOST_EXCHANGES_PATH % _q(vhost))
 
 	def get_vhost_exchange(self, vhost: str, exchange_name: str) -> dict:
 		"""Get an exchange on a specific vhost on the RabbitMQ server.
@@ -285,24 +440,23 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Information about the specified exchange.
 		"""
-		exchange_name = urllib.parse.quote(exchange_name, safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.get(f'/api/exchanges/{vhost}/{exchange_name}')
+		return self.get(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)))
 
-	def create_exchange(self, vhost: str, exchange_name: str, exchange: Exchange) -> dict:
+	def create_exchange(self, vhost: str, exchange_name: str, exchange: Exchange | dict) -> dict:
 		"""Create a new exchange on a specific vhost on the RabbitMQ server.
 
 		Args:
 			vhost (str): Name of the vhost.
 			exchange_name (str): Name of the exchange.
-			exchange (Exchange): Pydantic model representing the exchange.
+			exchange (Exchange | dict): Pydantic model representing the
+				exchange, or a precomputed payload dict.
 
 		Returns:
 			dict: Empty dictionary.
 		"""
-		exchange_name = urllib.parse.quote(exchange_name, safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.put(f'/api/exchanges/{vhost}/{exchange_name}', exchange.model_dump())
+		if isinstance(exchange, dict):
+			return self.put(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)), exchange)
+		return self.put_raw(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)), exchange.to_body_bytes())
 
 	def delete_exchange(self, vhost: str, exchange_name: str) -> dict:
 		"""Delete an exchange on a specific vhost on the RabbitMQ server.
@@ -314,17 +468,19 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Empty dictionary.
 		"""
-		exchange_name = urllib.parse.quote(exchange_name, safe='')
-		vhost = urllib.parse.quote(vhost, safe='')
-		return self.delete(f'/api/exchanges/{vhost}/{exchange_name}')
+		return self.delete(_EXCHANGE_PATH % (_q(vhost), _q(exchange_name)))
 
-	def get_bindings(self) -> list[dict]:
+	def get_bindings(self, columns: list[str] = None) -> list[dict]:
 		"""Get all bindings on the RabbitMQ server.
 
+		Args:
+			columns (list[str], optional): Restrict each binding to these
+				fields; the server drops everything else before serializing.
+
 		Returns:
 			list[dict]: A list of bindings.
 		"""
-		return self.get('/api/bindings')
+		return self.get('/api/bindings', params=_list_params(columns=columns))
 
 	def get_vhost_bindings(self, vhost: str) -> list[dict]:
 		"""Get all bindings for a specific vhost on the RabbitMQ server.
@@ -335,7 +491,7 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			list[dict]: List of bindings for the specified vhost.
 		"""
-		return self.get(f'/api/bindings/{vhost}')
+		return self.get(_VHOST_BINDINGS_PATH % _q(vhost))
 
 	def get_vhost_binding(self, vhost: str, exchange: str, queue: str) -> dict:
 		"""Get a binding for a specific vhost on the RabbitMQ server.
@@ -348,7 +504,7 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Information about the specified binding.
 		"""
-		return self.get(f'/api/bindings/{vhost}/e/{exchange}/q/{queue}')
+		return self.get(_BINDING_PATH % (_q(vhost), _q(exchange), _q(queue)))
 
 	def create_vhost_binding(self, vhost: str, exchange: str, queue: str, binding: Binding):
 		"""Create a new binding for a specific vhost on the RabbitMQ server.
@@ -362,6 +518,26 @@ class RabbitMQClient(BaseClient):
 		Returns:
 			dict: Empty dictionary.
 		"""
-		return self.post(f'/api/bindings/{vhost}/e/{exchange}/q/{queue}', binding.model_dump())
+		return self.post_raw(_BINDING_PATH % (_q(vhost), _q(exchange), _q(queue)), binding.to_body_bytes())
+
+	def import_definitions(self, definitions: dict, vhost: str = None) -> dict:
+		"""Import a definitions document on the RabbitMQ server.
+
+		This is the bulk path: a whole topology (vhosts, users, permissions,
+		queues, exchanges, bindings) built with
+		:class:`rabbitmq_api_client.definitions.DefinitionsBuilder` is uploaded
+		in one request instead of one PUT/POST per object. The single-object
+		methods remain for control-plane changes.
+
+		Args:
+			definitions (dict): The definitions document to import.
+			vhost (str, optional): Restrict the import to this vhost.
+
+		Returns:
+			dict: Empty dictionary.
+		"""
+		if vhost is None:
+			return self.post(_DEFINITIONS_PATH, definitions)
+		return self.post(_VHOST_DEFINITIONS_PATH % _q(vhost), definitions)
 
 
@@ -0,0 +1,139 @@
+from rabbitmq_api_client.schemas import (
+	Binding,
+	CreateQueue,
+	CreateUser,
+	CreateVhost,
+	Exchange,
+	Permissions,
+)
+
+
+class DefinitionsBuilder:
+	"""Builder for a RabbitMQ definitions document.
+
+	Collects vhosts, users, permissions, queues, exchanges and bindings from
+	the existing pydantic models and emits the nested dict structure expected
+	by ``POST /api/definitions``, so a whole topology can be uploaded in a
+	single request instead of one call per object.
+
+	Example:
+		builder = DefinitionsBuilder()
+		builder.add_vhost(CreateVhost(name='app'))
+		builder.add_queue('app', CreateQueue(name='events'))
+		client.import_definitions(builder.build())
+	"""
+
+	def __init__(self):
+		"""Initialize an empty definitions document."""
+		self._vhosts = []
+		self._users = []
+		self._permissions = []
+		self._queues = []
+		self._exchanges = []
+		self._bindings = []
+
+	def add_vhost(self, vhost: CreateVhost) -> 'DefinitionsBuilder':
+		"""Add a vhost to the document.
+
+		Args:
+			vhost (CreateVhost): Pydantic model representing the vhost.
+
+		Returns:
+			DefinitionsBuilder: This builder, for chaining.
+		"""
+		self._vhosts.append(vhost.model_dump(exclude_unset=True))
+		return self
+
+	def add_user(self, user: CreateUser) -> 'DefinitionsBuilder':
+		"""Add a user to the document.
+
+		Args:
+			user (CreateUser): Pydantic model representing the user.
+
+		Returns:
+			DefinitionsBuilder: This builder, for chaining.
+		"""
+		self._users.append({'name': user.name, 'password': user.password, 'tags': user.tags})
+		return self
+
+	def add_permissions(self, username: str, vhost: str, permissions: Permissions) -> 'DefinitionsBuilder':
+		"""Add user permissions on a vhost to the document.
+
+		Args:
+			username (str): Name of the user.
+			vhost (str): Name of the vhost.
+			permissions (Permissions): Pydantic model representing the permissions.
+
+		Returns:
+			DefinitionsBuilder: This builder, for chaining.
+		"""
+		self._permissions.append({'user': username, 'vhost': vhost} | permissions.model_dump())
+		return self
+
+	def add_queue(self, vhost: str, queue: CreateQueue) -> 'DefinitionsBuilder':
+		"""Add a queue to the document.
+
+		Args:
+			vhost (str): Name of the vhost.
+			queue (CreateQueue): Pydantic model representing the queue.
+
+		Returns:
+			DefinitionsBuilder: This builder, for chaining.
+		"""
+		self._queues.append(queue.model_dump(exclude_unset=True) | {'vhost': vhost})
+		return self
+
+	def add_exchange(self, vhost: str, exchange_name: str, exchange: Exchange) -> 'DefinitionsBuilder':
+		"""Add an exchange to the document.
+
+		Args:
+			vhost (str): Name of the vhost.
+			exchange_name (str): Name of the exchange.
+			exchange (Exchange): Pydantic model representing the exchange.
+
+		Returns:
+			DefinitionsBuilder: This builder, for chaining.
+		"""
+		self._exchanges.append(exchange.model_dump() | {'name': exchange_name, 'vhost': vhost})
+		return self
+
+	def add_binding(self, vhost: str, exchange: str, queue: str, binding: Binding) -> 'DefinitionsBuilder':
+		"""Add an exchange-to-queue binding to the document.
+
+		Args:
+			vhost (str): Name of the vhost.
+			exchange (str): Name of the source exchange.
+			queue (str): Name of the destination queue.
+			binding (Binding): Pydantic model representing the binding.
+
+		Returns:
+			DefinitionsBuilder: This builder, for chaining.
+		"""
+		self._bindings.append(
+			{
+				'source': exchange,
+				'vhost': vhost,
+				'destination': queue,
+				'destination_type': 'queue',
+				'arguments': {},
+			}
+			| binding.model_dump()
+		)
+		return self
+
+	def build(self) -> dict:
+		"""Build the definitions document.
+
+		Returns:
+			dict: The document to pass to ``import_definitions``. Empty
+			sections are omitted.
+		"""
+		sections = {
+			'vhosts': self._vhosts,
+			'users': self._users,
+			'permissions': self._permissions,
+			'queues': self._queues,
+			'exchanges': self._exchanges,
+			'bindings': self._bindings,
+		}
+		return {key: value for key, value in sections.items() if value}
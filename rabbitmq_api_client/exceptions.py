@@ -1,16 +1,57 @@
-import json
+from functools import cached_property
+from typing import ClassVar
+
+try:
+	# orjson's JSONDecodeError subclasses ValueError, so the except clause
+	# below covers both parsers.
+	from orjson import loads as _loads
+except ImportError:
+	from json import loads as _loads
 
 
 class RabbitMQAPIError(Exception):
-	"""Base class for all RabbitMQ API errors."""
+	"""Base class for all RabbitMQ API errors.
+
+	The error body is only JSON-decoded on first access to ``error``,
+	``reason`` or ``message``; call sites that just check ``status_code``
+	never pay for the parse.
+	"""
+
+	# Exception instances keep their __dict__ (cached_property needs it);
+	# the slots still give the eagerly-set attributes fixed offsets.
+	__slots__ = ('_text', 'status_code')
+
+	# Shared default; subclasses override with their own class attribute, so
+	# no per-instance store is paid for it.
+	code: ClassVar[int] = 0
 
 	def __init__(self, response, status_code, text):
-		self.code = 0
+		self._text = text
+		self.status_code = status_code
+
+	@cached_property
+	def _payload(self):
+		"""Decode the error body once, on first access; None if not JSON."""
 		try:
-			json_response = json.loads(text)
+			return _loads(self._text)
 		except ValueError:
-			self.message = f'Invalid JSON error message from RabbitMQ: {response.text}'
-		else:
-			self.error = json_response.get('error', 'Unknown error')
-			self.reason = json_response.get('reason', 'Unknown reason')
-		self.status_code = status_code
+			return None
+
+	@cached_property
+	def error(self):
+		"""The error reported by RabbitMQ."""
+		payload = self._payload
+		return 'Unknown error' if payload is None else payload.get('error', 'Unknown error')
+
+	@cached_property
+	def reason(self):
+		"""The reason reported by RabbitMQ."""
+		payload = self._payload
+		return 'Unknown reason' if payload is None else payload.get('reason', 'Unknown reason')
+
+	@cached_property
+	def message(self):
+		"""Fallback message when the error body is not valid JSON."""
+		if self._payload is None:
+			return f'Invalid JSON error message from RabbitMQ: {self._text}'
+		return None
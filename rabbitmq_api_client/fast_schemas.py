@@ -0,0 +1,34 @@
+"""Validation-free counterparts of the hot-path request schemas.
+
+These slotted dataclasses mirror ``CreateQueue``/``Exchange``/``Binding`` but
+skip pydantic entirely: orjson serializes dataclasses natively, so a bulk
+caller with known-valid inputs pays neither validation nor a dict copy per
+item. The pydantic schemas in :mod:`rabbitmq_api_client.schemas` remain the
+validated, user-facing API.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class FastQueue:
+	name: str
+	auto_delete: bool = False
+	durable: bool = True
+	arguments: dict = field(default_factory=dict)
+	node: str = ''
+
+
+@dataclass(slots=True)
+class FastExchange:
+	type: str = 'direct'
+	durable: bool = True
+	auto_delete: bool = False
+	internal: bool = False
+	arguments: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class FastBinding:
+	routing_key: str
+	arguments: dict = field(default_factory=dict)
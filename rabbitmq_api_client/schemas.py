@@ -1,10 +1,23 @@
-from enum import Enum
+from typing import Literal, Required, TypedDict
 
-from pydantic import BaseModel
-from pydantic import Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
-class CreateUser(BaseModel):
+class _FastConstruct:
+    """Mixin adding a validation-skipping factory for trusted callers."""
+
+    @classmethod
+    def fast(cls, **kwargs):
+        """Build the model without validation via `model_construct`.
+
+        For callers whose inputs are known-valid (e.g. literals in code);
+        skips the pydantic-core validation pass entirely.
+        """
+        return cls.model_construct(**kwargs)
+
+
+class CreateUser(_FastConstruct, BaseModel):
     """
     Tags can be one of:
     - management : 	User can access the management plugin
@@ -15,48 +28,173 @@ class CreateUser(BaseModel):
     - administrator: User can do everything monitoring can do, manage users, vhosts and permissions, close other user's
     connections, and manage policies and parameters for all vhosts.
     """
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     name: str
     password: str
     tags: str = Field("",
                       description="Comma-separated list of tags to apply to the user.",
                       examples=["management,policymaker,monitoring,administrator,impersonator"])
 
+    def to_body_bytes(self) -> bytes:
+        """Serialize the request body once, for reuse with `BaseClient.put_raw`."""
+        return orjson.dumps({'password': self.password, 'tags': self.tags})
+
+
+class CreateUserPayload(TypedDict, total=False):
+    """Plain-dict form of :class:`CreateUser` for the unvalidated fast path.
+
+    TypedDicts exist only for the type checker -- at runtime this is an
+    ordinary dict, so trusted callers (e.g. provisioning loops with
+    known-valid inputs) skip pydantic construction and validation entirely.
+    """
+
+    name: Required[str]
+    password: Required[str]
+    tags: str
+
 
-class QueueType(str, Enum):
-    classic = 'classic'
-    quorum = 'quorum'
-    stream = 'stream'
+# Literal validation is a single hash lookup in pydantic-core, where an Enum
+# would construct and look up a member on every validation.
+QueueType = Literal['classic', 'quorum', 'stream']
 
 
-class CreateVhost(BaseModel):
+class CreateVhost(_FastConstruct, BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     name: str
     tracing: bool = False
-    tags: str = ''
+    tags: list[str] = Field(default_factory=list)
     description: str = ''
-    default_queue_type: QueueType = QueueType.quorum
+    default_queue_type: QueueType = 'quorum'
+
+    @field_validator('tags', mode='before')
+    @classmethod
+    def _split_tags(cls, value):
+        """Accept the comma-separated string form the management API also uses.
+
+        Splitting once at validation time means readers get a list directly
+        instead of re-splitting the string on every access.
+        """
+        if isinstance(value, str):
+            return value.split(',') if value else []
+        return value
+
+
+class CreateVhostPayload(TypedDict, total=False):
+    """Plain-dict form of :class:`CreateVhost`; see :class:`CreateUserPayload`."""
+
+    name: Required[str]
+    tracing: bool
+    tags: list[str]
+    description: str
+    default_queue_type: QueueType
 
 
-class CreateQueue(BaseModel):
+class CreateQueue(_FastConstruct, BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     name: str
     auto_delete: bool = False
     durable: bool = True
-    arguments: dict = {}
+    arguments: dict = Field(default_factory=dict)
     node: str = ''
 
 
+class CreateQueuePayload(TypedDict, total=False):
+    """Plain-dict form of :class:`CreateQueue`; see :class:`CreateUserPayload`."""
+
+    name: Required[str]
+    auto_delete: bool
+    durable: bool
+    arguments: dict
+    node: str
+
+
 class Permissions(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     configure: str = Field('^$', description="Configure permission")
     write: str = Field('^$', description="Write permission")
     read: str = Field('^$', description="Read permission")
 
+    def to_body_bytes(self) -> bytes:
+        """Serialize the request body once, for reuse with `BaseClient.put_raw`.
+
+        The fields are plain primitives, so the instance dict serializes
+        directly and the `model_dump` pass is skipped.
+        """
+        return orjson.dumps(self.__dict__)
+
 
 class Exchange(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     type: str = 'direct'
     durable: bool = True
     auto_delete: bool = False
     internal: bool = False
-    arguments: dict = {}
+    arguments: dict = Field(default_factory=dict)
+
+    def to_body_bytes(self) -> bytes:
+        """Serialize the request body once, for reuse with `BaseClient.put_raw`."""
+        return orjson.dumps(self.__dict__)
 
 
 class Binding(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     routing_key: str
+
+    def to_body_bytes(self) -> bytes:
+        """Serialize the request body once, for reuse with `BaseClient.post_raw`."""
+        return orjson.dumps(self.__dict__)
+
+
+class QueueInfo(BaseModel):
+    """Subset of the queue fields returned by the management API.
+
+    Extra fields are kept, so the model works with or without a `columns`
+    projection.
+    """
+
+    model_config = ConfigDict(extra='allow')
+
+    name: str
+    vhost: str
+    messages: int = 0
+    consumers: int = 0
+    state: str = ''
+
+
+# Built once at import time; use with `BaseClient.get_json_as` to parse
+# response bytes straight into models without an intermediate dict tree.
+QUEUES_ADAPTER = TypeAdapter(list[QueueInfo])
+
+# Adapters for the request schemas, likewise built once. Constructing a
+# TypeAdapter builds the pydantic-core schema, which is far more expensive
+# than the validation it performs; never create these per call.
+CREATE_USER_ADAPTER = TypeAdapter(CreateUser)
+CREATE_VHOST_ADAPTER = TypeAdapter(CreateVhost)
+CREATE_QUEUE_ADAPTER = TypeAdapter(CreateQueue)
+
+
+def validate_create_user(data: CreateUserPayload | dict) -> CreateUser:
+    """Validate a payload dict into a :class:`CreateUser`.
+
+    For callers that build payload dicts from untrusted input and want them
+    checked before handing them to the client; validation runs against the
+    adapter built at import time, so only the Rust-side pass is paid per call.
+    """
+    return CREATE_USER_ADAPTER.validate_python(data)
+
+
+def validate_create_vhost(data: CreateVhostPayload | dict) -> CreateVhost:
+    """Validate a payload dict into a :class:`CreateVhost`; see :func:`validate_create_user`."""
+    return CREATE_VHOST_ADAPTER.validate_python(data)
+
+
+def validate_create_queue(data: CreateQueuePayload | dict) -> CreateQueue:
+    """Validate a payload dict into a :class:`CreateQueue`; see :func:`validate_create_user`."""
+    return CREATE_QUEUE_ADAPTER.validate_python(data)
@@ -1,56 +1,67 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from rabbitmq_api_client.client import RabbitMQClient
 from rabbitmq_api_client.exceptions import RabbitMQAPIError
 from rabbitmq_api_client.schemas import CreateUser, CreateVhost
 
+# Canonical payloads, validated once at import; the models are frozen, so
+# sharing them across tests is safe.
+TEST_USER = CreateUser(name='test', password='test', tags='administrator,management')
+TEST_VHOST = CreateVhost(name='test', default_queue_type='quorum')
+
 
 class TestBaseClient(TestCase):
-	def setUp(self):
-		self.client = RabbitMQClient('http://localhost:15672', 'user', 'password')
+	# One client (and connection pool) per test class; each test would
+	# otherwise pay a fresh TCP handshake in setUp.
+	@classmethod
+	def setUpClass(cls):
+		cls.client = RabbitMQClient('http://localhost:15672', 'user', 'password')
+
+	@classmethod
+	def tearDownClass(cls):
+		cls.client.close()
+
+
+def _delete_all(delete, names):
+	"""Issue the DELETEs concurrently; the loop is latency-bound, not CPU-bound."""
+	with ThreadPoolExecutor(max_workers=8) as executor:
+		list(executor.map(delete, names))
 
 
 class TestClientCommon(TestBaseClient):
 	def tearDown(self):
 		list_vhosts = self.client.get_vhosts()
-		for vhost in list_vhosts:
-			self.client.delete_vhost(vhost['name'])
-		self.client.close()
+		_delete_all(self.client.delete_vhost, [vhost['name'] for vhost in list_vhosts])
 
 	def test_get_overview(self):
 		response = self.client.get_overview()
-		self.assertIs(type(response), dict)
+		self.assertIsInstance(response, dict)
 
 	def test_get_cluster_name(self):
 		response = self.client.get_cluster_name()
-		self.assertIs(type(response), dict)
+		self.assertIsInstance(response, dict)
 
 
 class TestClientUser(TestBaseClient):
-
-	def tearDown(self):
-		list_users = self.client.get_users()
-		for user in list_users:
-			if user['name'] != 'user':
-				self.client.delete_user(user['name'])
-		self.client.close()
+	# Each test registers cleanup for exactly what it creates via addCleanup,
+	# instead of a tearDown that re-fetches the whole user list per test.
 
 	def test_get_users(self):
 		users = self.client.get_users()
-		self.assertIs(type(users), list)
+		self.assertIsInstance(users, list)
 		self.assertEqual(len(users), 1)
 		self.assertEqual(users[0]['name'], 'user')
 		self.assertEqual(users[0]['tags'], ['administrator'])
 
 	def test_create_user(self):
-		user = CreateUser(name='test', password='test', tags='administrator,management')
-		response = self.client.create_user(user)
+		response = self.client.create_user(TEST_USER)
+		self.addCleanup(self.client.delete_user, TEST_USER.name)
 		self.assertEqual({}, response)
 
 	def test_delete_user(self):
-		user = CreateUser(name='test', password='test', tags='administrator,management')
-		response = self.client.create_user(user)
+		response = self.client.create_user(TEST_USER)
 		self.assertEqual({}, response)
 		response = self.client.delete_user('test')
 		self.assertEqual({}, response)
@@ -66,17 +77,16 @@ class TestClientUser(TestBaseClient):
 
 
 class TestClientVhost(TestBaseClient):
-	def tearDown(self):
-		response = self.client.get_vhosts()
-		for vhost in response:
-			self.client.delete_vhost(vhost['name'])
+	# Cleanup is registered per test for the vhosts it creates; see
+	# TestClientUser.
 
 	def test_get_vhosts(self):
 		list_vhosts = self.client.get_vhosts()
-		self.assertIs(type(list_vhosts), list)
-		self.client.create_vhost(CreateVhost(name='test', default_queue_type='quorum'))
+		self.assertIsInstance(list_vhosts, list)
+		self.client.create_vhost(TEST_VHOST)
+		self.addCleanup(self.client.delete_vhost, TEST_VHOST.name)
 		list_vhosts = self.client.get_vhosts()
-		self.assertIs(type(list_vhosts), list)
+		self.assertIsInstance(list_vhosts, list)
 		self.assertEqual(len(list_vhosts), 1)
 
 	def test_get_vhost(self):
@@ -87,10 +97,11 @@ class TestClientVhost(TestBaseClient):
 			description='description',
 		)
 		self.client.create_vhost(vhost)
+		self.addCleanup(self.client.delete_vhost, vhost.name)
 		response = self.client.get_vhost('test')
 		self.assertEqual(response['name'], 'test')
 		self.assertEqual(response['tracing'], False)
-		self.assertEqual(response['tags'], vhost.tags.split(','))
+		self.assertEqual(response['tags'], vhost.tags)
 		self.assertEqual(response['description'], vhost.description)
 		self.assertEqual(response['default_queue_type'], vhost.default_queue_type)
 
@@ -102,8 +113,8 @@ class TestClientVhost(TestBaseClient):
 		self.assertEqual(context.exception.reason, 'Not Found')
 
 	def test_create_vhost(self):
-		vhost = CreateVhost(name='test', default_queue_type='quorum')
-		response = self.client.create_vhost(vhost)
+		response = self.client.create_vhost(TEST_VHOST)
+		self.addCleanup(self.client.delete_vhost, TEST_VHOST.name)
 		self.assertEqual({}, response)
 
 	def test_delete_vhost(self):
@@ -0,0 +1,33 @@
+import unittest
+from unittest import TestCase
+
+from rabbitmq_api_client.exceptions import RabbitMQAPIError
+
+
+class TestRabbitMQAPIError(TestCase):
+	def test_parses_json_error_body(self):
+		error = RabbitMQAPIError(None, 404, '{"error": "Object Not Found", "reason": "Not Found"}')
+		self.assertEqual(error.status_code, 404)
+		self.assertEqual(error.error, 'Object Not Found')
+		self.assertEqual(error.reason, 'Not Found')
+
+	def test_invalid_json_body(self):
+		error = RabbitMQAPIError(None, 500, 'not json')
+		self.assertEqual(error.message, 'Invalid JSON error message from RabbitMQ: not json')
+		self.assertEqual(error.error, 'Unknown error')
+		self.assertEqual(error.reason, 'Unknown reason')
+
+	def test_body_is_parsed_lazily(self):
+		error = RabbitMQAPIError(None, 404, '{"error": "Object Not Found", "reason": "Not Found"}')
+		self.assertNotIn('_payload', error.__dict__)
+		self.assertEqual(error.error, 'Object Not Found')
+		self.assertIn('_payload', error.__dict__)
+
+	def test_eager_attributes_use_slots(self):
+		error = RabbitMQAPIError(None, 404, '{}')
+		self.assertIn('status_code', RabbitMQAPIError.__slots__)
+		self.assertNotIn('status_code', error.__dict__)
+
+
+if __name__ == '__main__':
+	unittest.main()